@@ -21,16 +21,56 @@ Output: MT25077_Part_D_Plots.pdf (multi-page PDF with all plots)
 import sys
 import os
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use("Agg")  # Non-interactive backend (no display needed)
 import matplotlib.backends.backend_pdf as pdf_backend
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import numpy as np
 
 # Configuration
 CSV_FILE = "MT25077_Part_D_CSV.csv"
 OUTPUT_PDF = "MT25077_Part_D_Plots.pdf"
 
-# Plot styling
-plt.style.use('seaborn-v0_8-darkgrid')
+# Measurement columns used by the plots
+NUMERIC_COLUMNS = ['Workers', 'CPU%', 'Memory(MB)', 'IO(KB/s)', 'Time(s)']
+
+# Column types for the CSV: categories for the repeated program/function
+# names; measurements stay float64 so the reported averages keep full precision
+COLUMN_DTYPES = {
+    'Program': 'category',
+    'Function': 'category',
+    'Workers': 'int32',
+    'CPU%': 'float64',
+    'Memory(KB)': 'int64',
+    'IO(KB/s)': 'float64',
+    'Time(s)': 'float64',
+}
+
+# Plot styling: the rc settings of the 'seaborn-v0_8-darkgrid' style, set
+# directly instead of loading the stylesheet
+matplotlib.rcParams.update({
+    'axes.axisbelow': True,
+    'axes.edgecolor': 'white',
+    'axes.facecolor': '#EAEAF2',
+    'axes.grid': True,
+    'axes.labelcolor': '.15',
+    'axes.linewidth': 0.0,
+    'font.family': ['sans-serif'],
+    'font.sans-serif': ['Arial', 'Liberation Sans', 'DejaVu Sans',
+                        'Bitstream Vera Sans', 'sans-serif'],
+    'grid.color': 'white',
+    'grid.linestyle': '-',
+    'legend.frameon': False,
+    'lines.solid_capstyle': 'round',
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'xtick.major.size': 0.0,
+    'xtick.minor.size': 0.0,
+    'ytick.color': '.15',
+    'ytick.major.size': 0.0,
+    'ytick.minor.size': 0.0,
+})
 COLORS = {
     'cpu': '#FF6B6B',  # Red
     'mem': '#4ECDC4',  # Teal
@@ -45,21 +85,28 @@ LINE_STYLES = {
     'b': '--',  # Dashed line for threads
 }
 
+# Worker counts shared by both programs (used for the side-by-side comparison)
+COMPARISON_WORKERS = np.array([2, 3, 4, 5], dtype=np.int32)
+
 def load_data(csv_file):
     """Load and validate CSV data."""
     try:
-        df = pd.read_csv(csv_file)
-        print(f"[INFO] Loaded data from {csv_file}")
-        print(f"[INFO] Shape: {df.shape[0]} rows, {df.shape[1]} columns")
-        print(f"[INFO] Columns: {', '.join(df.columns)}")
-
-        # Validate required columns
+        # Validate required columns against the header before the full read
         required_columns = ['Program', 'Function', 'Workers', 'CPU%', 'Memory(KB)', 'IO(KB/s)', 'Time(s)']
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        header = set(pd.read_csv(csv_file, nrows=0).columns)
+        missing_columns = [col for col in required_columns if col not in header]
         if missing_columns:
             print(f"[ERROR] Missing required columns: {', '.join(missing_columns)}")
             sys.exit(1)
 
+        df = pd.read_csv(csv_file, usecols=required_columns, dtype=COLUMN_DTYPES, engine='c')
+        print(f"[INFO] Loaded data from {csv_file}")
+        print(f"[INFO] Shape: {df.shape[0]} rows, {df.shape[1]} columns")
+        print(f"[INFO] Columns: {', '.join(df.columns)}")
+
+        # Memory in MB, converted once for all plots
+        df['Memory(MB)'] = df['Memory(KB)'].to_numpy(np.float32) * np.float32(1.0 / 1024)
+
         return df
     except FileNotFoundError:
         print(f"[ERROR] File not found: {csv_file}")
@@ -69,18 +116,93 @@ def load_data(csv_file):
         print(f"[ERROR] Failed to load CSV: {e}")
         sys.exit(1)
 
+def group_indices(df):
+    """Map each (program, function) pair present in df to its row indices,
+    sorted by worker count.
+
+    Works on the category codes of the Program and Function columns, so no
+    pandas selection is done per group.
+    """
+    program_codes = df['Program'].cat.codes.to_numpy()
+    function_codes = df['Function'].cat.codes.to_numpy()
+    workers = df['Workers'].to_numpy()
+
+    indices = {}
+    for p_code, program in enumerate(df['Program'].cat.categories):
+        for f_code, function in enumerate(df['Function'].cat.categories):
+            idx = np.flatnonzero((program_codes == p_code) & (function_codes == f_code))
+            if len(idx) > 0:
+                indices[(program, function)] = idx[np.argsort(workers[idx], kind='stable')]
+    return indices
+
+def speedup_column(times, indices):
+    """Speedup of every row relative to the fewest-workers run of its group.
+
+    All groups are normalised in one vectorised pass: the rows are laid out
+    group by group, each group's first time is repeated over its rows, and
+    the whole column is divided at once.
+    """
+    speedup = np.full(len(times), np.nan)  # Rows outside every group stay NaN
+    if not indices:
+        return speedup
+
+    order = np.concatenate(list(indices.values()))
+    counts = np.array([len(idx) for idx in indices.values()])
+    starts = np.cumsum(counts) - counts
+
+    ordered_times = times[order]
+    # A zero time (written by the Part D script when parsing fails) gives
+    # inf/NaN quietly, as the pandas division did
+    with np.errstate(divide='ignore', invalid='ignore'):
+        speedup[order] = np.repeat(ordered_times[starts], counts) / ordered_times
+    return speedup
+
+def group_arrays(columns, idx):
+    """Extract the plotted columns of one group as NumPy arrays."""
+    return {
+        'Workers': columns['Workers'][idx],
+        'CPU%': columns['CPU%'][idx],
+        'Memory(MB)': columns['Memory(MB)'][idx],
+        'IO(KB/s)': columns['IO(KB/s)'][idx],
+        'Time(s)': columns['Time(s)'][idx],
+        'Speedup': columns['Speedup'][idx],
+    }
+
+def select_workers(data, workers):
+    """Restrict the arrays of one group to the given worker counts."""
+    mask = np.isin(data['Workers'], workers)
+    return {column: values[mask] for column, values in data.items()}
+
+def new_figure(**kwargs):
+    """Create a figure on an Agg canvas, outside pyplot's figure registry."""
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
 def create_plots(df):
-    """Create all plots and return figure list."""
-    figures = []
+    """Create all plots, yielding each figure as soon as it is built."""
+    # Take the columns out of pandas once and split them by (program, function);
+    # each plot then looks up the NumPy arrays of its subset
+    columns = {column: df[column].to_numpy() for column in NUMERIC_COLUMNS}
+    indices = group_indices(df)
+    columns['Speedup'] = speedup_column(columns['Time(s)'], indices)  # For Plot 6
+    arrays = {key: group_arrays(columns, idx) for key, idx in indices.items()}
+    empty = group_arrays(columns, np.array([], dtype=np.intp))
+
+    # Program B restricted to Program A's worker counts (for Plot 5)
+    comparison_b = {function: select_workers(arrays.get(('b', function), empty),
+                                             COMPARISON_WORKERS)
+                    for function in ['cpu', 'mem', 'io']}
 
     # Plot 1: CPU% vs Workers (grouped by function, separate lines for programs)
     print("[INFO] Creating Plot 1: CPU% vs Workers")
-    fig1, ax1 = plt.subplots(figsize=(12, 8))
+    fig = new_figure(figsize=(12, 8))
+    ax = fig.subplots()
     for program in ['a', 'b']:
         for function in ['cpu', 'mem', 'io']:
-            data = df[(df['Program'] == program) & (df['Function'] == function)]
+            data = arrays.get((program, function), empty)
             label = f"Program {program.upper()} - {function.upper()}"
-            ax1.plot(data['Workers'], data['CPU%'],
+            ax.plot(data['Workers'], data['CPU%'],
                     marker=MARKERS[program],
                     linestyle=LINE_STYLES[program],
                     color=COLORS[function],
@@ -88,21 +210,22 @@ def create_plots(df):
                     markersize=8,
                     label=label)
 
-    ax1.set_xlabel('Number of Workers', fontsize=12, fontweight='bold')
-    ax1.set_ylabel('CPU Utilization (%)', fontsize=12, fontweight='bold')
-    ax1.set_title('CPU% vs Number of Workers\n(MT25077)', fontsize=14, fontweight='bold')
-    ax1.legend(loc='best', fontsize=10)
-    ax1.grid(True, alpha=0.3)
-    figures.append(fig1)
+    ax.set_xlabel('Number of Workers', fontsize=12, fontweight='bold')
+    ax.set_ylabel('CPU Utilization (%)', fontsize=12, fontweight='bold')
+    ax.set_title('CPU% vs Number of Workers\n(MT25077)', fontsize=14, fontweight='bold')
+    ax.legend(loc='best', fontsize=10)
+    ax.grid(True, alpha=0.3)
+    yield fig
 
     # Plot 2: Memory Usage vs Workers
     print("[INFO] Creating Plot 2: Memory Usage vs Workers")
-    fig2, ax2 = plt.subplots(figsize=(12, 8))
+    fig = new_figure(figsize=(12, 8))
+    ax = fig.subplots()
     for program in ['a', 'b']:
         for function in ['cpu', 'mem', 'io']:
-            data = df[(df['Program'] == program) & (df['Function'] == function)]
+            data = arrays.get((program, function), empty)
             label = f"Program {program.upper()} - {function.upper()}"
-            ax2.plot(data['Workers'], data['Memory(KB)'] / 1024,  # Convert to MB
+            ax.plot(data['Workers'], data['Memory(MB)'],
                     marker=MARKERS[program],
                     linestyle=LINE_STYLES[program],
                     color=COLORS[function],
@@ -110,21 +233,22 @@ def create_plots(df):
                     markersize=8,
                     label=label)
 
-    ax2.set_xlabel('Number of Workers', fontsize=12, fontweight='bold')
-    ax2.set_ylabel('Peak Memory Usage (MB)', fontsize=12, fontweight='bold')
-    ax2.set_title('Memory Usage vs Number of Workers\n(MT25077)', fontsize=14, fontweight='bold')
-    ax2.legend(loc='best', fontsize=10)
-    ax2.grid(True, alpha=0.3)
-    figures.append(fig2)
+    ax.set_xlabel('Number of Workers', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Peak Memory Usage (MB)', fontsize=12, fontweight='bold')
+    ax.set_title('Memory Usage vs Number of Workers\n(MT25077)', fontsize=14, fontweight='bold')
+    ax.legend(loc='best', fontsize=10)
+    ax.grid(True, alpha=0.3)
+    yield fig
 
     # Plot 3: Execution Time vs Workers
     print("[INFO] Creating Plot 3: Execution Time vs Workers")
-    fig3, ax3 = plt.subplots(figsize=(12, 8))
+    fig = new_figure(figsize=(12, 8))
+    ax = fig.subplots()
     for program in ['a', 'b']:
         for function in ['cpu', 'mem', 'io']:
-            data = df[(df['Program'] == program) & (df['Function'] == function)]
+            data = arrays.get((program, function), empty)
             label = f"Program {program.upper()} - {function.upper()}"
-            ax3.plot(data['Workers'], data['Time(s)'],
+            ax.plot(data['Workers'], data['Time(s)'],
                     marker=MARKERS[program],
                     linestyle=LINE_STYLES[program],
                     color=COLORS[function],
@@ -132,21 +256,22 @@ def create_plots(df):
                     markersize=8,
                     label=label)
 
-    ax3.set_xlabel('Number of Workers', fontsize=12, fontweight='bold')
-    ax3.set_ylabel('Execution Time (seconds)', fontsize=12, fontweight='bold')
-    ax3.set_title('Execution Time vs Number of Workers\n(MT25077)', fontsize=14, fontweight='bold')
-    ax3.legend(loc='best', fontsize=10)
-    ax3.grid(True, alpha=0.3)
-    figures.append(fig3)
+    ax.set_xlabel('Number of Workers', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Execution Time (seconds)', fontsize=12, fontweight='bold')
+    ax.set_title('Execution Time vs Number of Workers\n(MT25077)', fontsize=14, fontweight='bold')
+    ax.legend(loc='best', fontsize=10)
+    ax.grid(True, alpha=0.3)
+    yield fig
 
     # Plot 4: I/O Usage vs Workers
     print("[INFO] Creating Plot 4: I/O Usage vs Workers")
-    fig4, ax4 = plt.subplots(figsize=(12, 8))
+    fig = new_figure(figsize=(12, 8))
+    ax = fig.subplots()
     for program in ['a', 'b']:
         for function in ['cpu', 'mem', 'io']:
-            data = df[(df['Program'] == program) & (df['Function'] == function)]
+            data = arrays.get((program, function), empty)
             label = f"Program {program.upper()} - {function.upper()}"
-            ax4.plot(data['Workers'], data['IO(KB/s)'],
+            ax.plot(data['Workers'], data['IO(KB/s)'],
                     marker=MARKERS[program],
                     linestyle=LINE_STYLES[program],
                     color=COLORS[function],
@@ -154,23 +279,24 @@ def create_plots(df):
                     markersize=8,
                     label=label)
 
-    ax4.set_xlabel('Number of Workers', fontsize=12, fontweight='bold')
-    ax4.set_ylabel('I/O Throughput (KB/s)', fontsize=12, fontweight='bold')
-    ax4.set_title('I/O Usage vs Number of Workers\n(MT25077)', fontsize=14, fontweight='bold')
-    ax4.legend(loc='best', fontsize=10)
-    ax4.grid(True, alpha=0.3)
-    figures.append(fig4)
+    ax.set_xlabel('Number of Workers', fontsize=12, fontweight='bold')
+    ax.set_ylabel('I/O Throughput (KB/s)', fontsize=12, fontweight='bold')
+    ax.set_title('I/O Usage vs Number of Workers\n(MT25077)', fontsize=14, fontweight='bold')
+    ax.legend(loc='best', fontsize=10)
+    ax.grid(True, alpha=0.3)
+    yield fig
 
     # Plot 5: Comparison - Processes vs Threads (2x2 subplots for each metric)
     print("[INFO] Creating Plot 5: Processes vs Threads Comparison")
-    fig5, axes = plt.subplots(2, 2, figsize=(16, 12))
-    fig5.suptitle('Processes vs Threads Comparison by Worker Type\n(MT25077)',
-                  fontsize=16, fontweight='bold')
+    fig = new_figure(figsize=(16, 12), layout='constrained')
+    axes = fig.subplots(2, 2)
+    fig.suptitle('Processes vs Threads Comparison by Worker Type\n(MT25077)',
+                 fontsize=16, fontweight='bold')
 
     # Define metrics and their properties
     metrics = [
         ('CPU%', 'CPU Utilization (%)'),
-        ('Memory(KB)', 'Memory Usage (MB)'),
+        ('Memory(MB)', 'Memory Usage (MB)'),
         ('Time(s)', 'Execution Time (s)'),
         ('IO(KB/s)', 'I/O Throughput (KB/s)')
     ]
@@ -180,52 +306,42 @@ def create_plots(df):
 
         for function in ['cpu', 'mem', 'io']:
             # Program A (processes)
-            data_a = df[(df['Program'] == 'a') & (df['Function'] == function)]
+            data_a = arrays.get(('a', function), empty)
             # Program B (threads) - filter to match Program A's worker counts
-            data_b = df[(df['Program'] == 'b') & (df['Function'] == function) &
-                       (df['Workers'].isin([2, 3, 4, 5]))]
-
-            # Convert memory to MB if needed
-            if metric == 'Memory(KB)':
-                ax.plot(data_a['Workers'], data_a[metric] / 1024,
-                       marker='o', linestyle='-', linewidth=2, markersize=8,
-                       color=COLORS[function], label=f'{function.upper()} (Processes)')
-                ax.plot(data_b['Workers'], data_b[metric] / 1024,
-                       marker='s', linestyle='--', linewidth=2, markersize=8,
-                       color=COLORS[function], label=f'{function.upper()} (Threads)')
-            else:
-                ax.plot(data_a['Workers'], data_a[metric],
-                       marker='o', linestyle='-', linewidth=2, markersize=8,
-                       color=COLORS[function], label=f'{function.upper()} (Processes)')
-                ax.plot(data_b['Workers'], data_b[metric],
-                       marker='s', linestyle='--', linewidth=2, markersize=8,
-                       color=COLORS[function], label=f'{function.upper()} (Threads)')
+            data_b = comparison_b[function]
+
+            ax.plot(data_a['Workers'], data_a[metric],
+                   marker='o', linestyle='-', linewidth=2, markersize=8,
+                   color=COLORS[function], label=f'{function.upper()} (Processes)')
+            ax.plot(data_b['Workers'], data_b[metric],
+                   marker='s', linestyle='--', linewidth=2, markersize=8,
+                   color=COLORS[function], label=f'{function.upper()} (Threads)')
 
         ax.set_xlabel('Number of Workers', fontsize=11, fontweight='bold')
         ax.set_ylabel(ylabel, fontsize=11, fontweight='bold')
         ax.legend(loc='best', fontsize=9)
         ax.grid(True, alpha=0.3)
-
-    plt.tight_layout()
-    figures.append(fig5)
+    yield fig
 
     # Plot 6: Scalability Analysis - Speedup for each worker type
     print("[INFO] Creating Plot 6: Scalability Analysis")
-    fig6, axes = plt.subplots(1, 3, figsize=(18, 6))
-    fig6.suptitle('Scalability Analysis: Execution Time Speedup\n(MT25077)',
-                  fontsize=16, fontweight='bold')
+    fig = new_figure(figsize=(18, 6), layout='constrained')
+    axes = fig.subplots(1, 3)
+    fig.suptitle('Scalability Analysis: Execution Time Speedup\n(MT25077)',
+                 fontsize=16, fontweight='bold')
+
+    # End point of the ideal linear speedup line, shared by all subplots
+    # (NaN when the CSV has no data rows, like the pandas max it replaces)
+    max_workers = columns['Workers'].max() if len(columns['Workers']) > 0 else np.nan
 
     for idx, function in enumerate(['cpu', 'mem', 'io']):
         ax = axes[idx]
 
         for program in ['a', 'b']:
-            data = df[(df['Program'] == program) & (df['Function'] == function)].sort_values('Workers')
-            if len(data) > 0:
-                baseline_time = data.iloc[0]['Time(s)']  # Time with minimum workers
-                speedup = baseline_time / data['Time(s)']
-
+            data = arrays.get((program, function), empty)
+            if len(data['Workers']) > 0:
                 label = f"Program {program.upper()}"
-                ax.plot(data['Workers'], speedup,
+                ax.plot(data['Workers'], data['Speedup'],
                        marker=MARKERS[program],
                        linestyle=LINE_STYLES[program],
                        linewidth=2,
@@ -233,7 +349,6 @@ def create_plots(df):
                        label=label)
 
         # Add ideal linear speedup line
-        max_workers = df['Workers'].max()
         ax.plot([2, max_workers], [1, max_workers/2],
                'k:', linewidth=1, label='Ideal Linear Speedup')
 
@@ -242,22 +357,28 @@ def create_plots(df):
         ax.set_title(f'{function.upper()} Worker', fontsize=12, fontweight='bold')
         ax.legend(loc='best', fontsize=9)
         ax.grid(True, alpha=0.3)
-
-    plt.tight_layout()
-    figures.append(fig6)
-
-    return figures
+    yield fig
 
 def save_plots(figures, output_file):
-    """Save all figures to a multi-page PDF."""
+    """Save figures to a multi-page PDF, one page at a time.
+
+    Each figure is cleared as soon as its page is written, which releases
+    its axes and artists right away instead of leaving them to the cyclic
+    garbage collector. Returns the number of pages saved.
+    """
+    # Printed before the first page: figures are created lazily, so the
+    # "[INFO] Creating Plot N" lines follow this one as each page is built
     print(f"[INFO] Saving plots to {output_file}...")
 
+    num_plots = 0
     with pdf_backend.PdfPages(output_file) as pdf:
         for fig in figures:
             pdf.savefig(fig, bbox_inches='tight')
-            plt.close(fig)
+            fig.clear()  # Release the saved page's axes and artists now
+            num_plots += 1
 
-    print(f"[INFO] Successfully saved {len(figures)} plots to {output_file}")
+    print(f"[INFO] Successfully saved {num_plots} plots to {output_file}")
+    return num_plots
 
 def print_statistics(df):
     """Print summary statistics."""
@@ -265,21 +386,32 @@ def print_statistics(df):
     print("Summary Statistics (MT25077)")
     print("="*70)
 
+    # All per-group reductions in a single grouped pass
+    agg = df.groupby(['Program', 'Function'], sort=False, observed=True).agg(
+        cpu=('CPU%', 'mean'),
+        mem=('Memory(KB)', 'mean'),
+        t=('Time(s)', 'mean'),
+        io=('IO(KB/s)', 'mean'),
+        wmin=('Workers', 'min'),
+        wmax=('Workers', 'max'),
+    )
+    stats = dict(zip(agg.index, agg.itertuples(index=False)))
+
     for program in ['a', 'b']:
         program_name = "Process-based (A)" if program == 'a' else "Thread-based (B)"
         print(f"\n{program_name}:")
         print("-"*70)
 
         for function in ['cpu', 'mem', 'io']:
-            data = df[(df['Program'] == program) & (df['Function'] == function)]
+            row = stats.get((program, function))
 
-            if len(data) > 0:
+            if row is not None:
                 print(f"\n  {function.upper()} Worker:")
-                print(f"    Workers range:  {data['Workers'].min()} - {data['Workers'].max()}")
-                print(f"    Avg CPU%:       {data['CPU%'].mean():.2f}%")
-                print(f"    Avg Memory:     {data['Memory(KB)'].mean() / 1024:.2f} MB")
-                print(f"    Avg Time:       {data['Time(s)'].mean():.2f} seconds")
-                print(f"    Avg I/O:        {data['IO(KB/s)'].mean():.2f} KB/s")
+                print(f"    Workers range:  {row.wmin} - {row.wmax}")
+                print(f"    Avg CPU%:       {row.cpu:.2f}%")
+                print(f"    Avg Memory:     {row.mem / 1024:.2f} MB")
+                print(f"    Avg Time:       {row.t:.2f} seconds")
+                print(f"    Avg I/O:        {row.io:.2f} KB/s")
 
     print("\n" + "="*70)
 
@@ -301,10 +433,9 @@ def main():
     print("\n" + "="*70)
     print("Generating Plots...")
     print("="*70)
-    figures = create_plots(df)
 
-    # Save plots
-    save_plots(figures, OUTPUT_PDF)
+    # Save plots (figures are built lazily, one page at a time)
+    num_plots = save_plots(create_plots(df), OUTPUT_PDF)
 
     # Summary
     print("\n" + "="*70)
@@ -312,7 +443,7 @@ def main():
     print("="*70)
     print(f"Input file:  {CSV_FILE}")
     print(f"Output file: {OUTPUT_PDF}")
-    print(f"Total plots: {len(figures)}")
+    print(f"Total plots: {num_plots}")
     print("="*70)
 
 if __name__ == "__main__":
@@ -16,10 +16,13 @@ Run this script to regenerate the plots:
 Author: MT25077
 """
 
+from multiprocessing import Pool
+
 import matplotlib
 matplotlib.use("Agg")  # Non-interactive backend (no display needed)
-import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Patch
 import numpy as np
 
 # ============================================================
@@ -38,50 +41,64 @@ SYSTEM_INFO = (
 
 MSG_SIZES = [1024, 4096, 65536, 1048576]          # Bytes
 MSG_LABELS = ["1 KB", "4 KB", "64 KB", "1 MB"]
+MSG_POSITIONS = np.arange(len(MSG_SIZES))        # Bar-group x positions
 THREAD_COUNTS = [1, 2, 4, 8]
 
 # ============================================================
 # HARDCODED EXPERIMENTAL DATA
 # Values taken from MT25077_Part_B_Results.csv
+# Each array has one row per implementation, in IMPLS order
 # ============================================================
 
+IMPLS = ("two_copy", "one_copy", "zero_copy")
+
 # --- Plot 1: Throughput (Gbps) vs Message Size ---
-# Rows: msg_sizes [1KB, 4KB, 64KB, 1MB]
+# Columns: msg_sizes [1KB, 4KB, 64KB, 1MB]
 # Measured with thread_count = 4
 
-throughput_two_copy  = [9.3742, 14.4076, 38.9824, 44.0402]
-throughput_one_copy  = [7.0840, 13.6835, 42.9614, 48.4065]
-throughput_zero_copy = [4.6127, 10.2657, 30.1563, 35.3253]
+throughput = np.array([
+    [9.3742, 14.4076, 38.9824, 44.0402],   # two_copy
+    [7.0840, 13.6835, 42.9614, 48.4065],   # one_copy
+    [4.6127, 10.2657, 30.1563, 35.3253],   # zero_copy
+], dtype=np.float64)
 
 # --- Plot 2: Latency (us) vs Thread Count ---
-# Rows: thread_counts [1, 2, 4, 8]
+# Columns: thread_counts [1, 2, 4, 8]
 # Measured with msg_size = 4096
 
-latency_two_copy  = [8.26, 9.10, 9.04, 6.98]
-latency_one_copy  = [9.57, 9.29, 9.53, 8.64]
-latency_zero_copy = [12.25, 12.25, 12.71, 16.45]
+latency = np.array([
+    [8.26, 9.10, 9.04, 6.98],              # two_copy
+    [9.57, 9.29, 9.53, 8.64],              # one_copy
+    [12.25, 12.25, 12.71, 16.45],          # zero_copy
+], dtype=np.float64)
 
 # --- Plot 3: Cache Misses vs Message Size ---
-# L1 data cache misses; rows: msg_sizes [1KB, 4KB, 64KB, 1MB]
+# L1 data cache misses; columns: msg_sizes [1KB, 4KB, 64KB, 1MB]
 # Measured with thread_count = 4
 
-l1_misses_two_copy  = [3963320820, 3375278746, 2943379236, 3123572797]
-l1_misses_one_copy  = [3237920369, 3187780795, 3218773154, 3461652149]
-l1_misses_zero_copy = [2993598361, 3140791657, 3077558012, 3131315716]
+l1_misses = np.array([
+    [3963320820, 3375278746, 2943379236, 3123572797],   # two_copy
+    [3237920369, 3187780795, 3218773154, 3461652149],   # one_copy
+    [2993598361, 3140791657, 3077558012, 3131315716],   # zero_copy
+], dtype=np.float64)
 
 # Context switches (used instead of LLC misses which reported 0 on AMD Zen 4 veth)
-ctx_sw_two_copy  = [1895182, 2509493, 774042, 853238]
-ctx_sw_one_copy  = [1627504, 3328111, 889593, 931450]
-ctx_sw_zero_copy = [3209825, 3075449, 1678570, 714696]
+ctx_sw = np.array([
+    [1895182, 2509493, 774042, 853238],    # two_copy
+    [1627504, 3328111, 889593, 931450],    # one_copy
+    [3209825, 3075449, 1678570, 714696],   # zero_copy
+], dtype=np.float64)
 
 # --- Plot 4: CPU Cycles per Byte Transferred ---
-# Rows: msg_sizes [1KB, 4KB, 64KB, 1MB]
+# Columns: msg_sizes [1KB, 4KB, 64KB, 1MB]
 # Calculated as: total_cycles / total_bytes
 # Measured with thread_count = 4
 
-cycles_per_byte_two_copy  = [11.99, 6.52, 2.06, 1.95]
-cycles_per_byte_one_copy  = [14.30, 5.96, 1.87, 1.84]
-cycles_per_byte_zero_copy = [17.98, 7.99, 2.96, 2.60]
+cycles_per_byte = np.array([
+    [11.99, 6.52, 2.06, 1.95],             # two_copy
+    [14.30, 5.96, 1.87, 1.84],             # one_copy
+    [17.98, 7.99, 2.96, 2.60],             # zero_copy
+], dtype=np.float64)
 
 
 # ============================================================
@@ -104,56 +121,72 @@ LABELS = {
     "zero_copy": "Zero-Copy (MSG_ZEROCOPY)",
 }
 
-plt.rcParams.update({
+# (label, color, marker) per implementation, in IMPLS order
+IMPL_STYLES = [(LABELS[impl], COLORS[impl], MARKERS[impl]) for impl in IMPLS]
+
+# Resolution of the saved PNGs; plots that need more detail can pass
+# their own dpi to save_plot
+SAVE_DPI = 100
+
+matplotlib.rcParams.update({
     "font.size": 11,
     "figure.figsize": (9, 6),
-    "figure.dpi": 150,
     "axes.grid": True,
     "grid.alpha": 0.3,
 })
 
 
-def plot_throughput_vs_msgsize():
+def save_plot(fig, filename, dpi=SAVE_DPI):
+    """Save a finished plot to a PNG file."""
+    fig.savefig(filename, dpi=dpi, bbox_inches="tight")
+
+
+def grouped_bars(ax, x, heights, width):
+    """Draw one bar per implementation at each x position in a single call.
+
+    heights has one row per implementation (IMPLS order). Returns proxy
+    handles for the legend, since the bars share a single container.
+    """
+    offsets = (np.arange(len(IMPLS)) - 1) * width
+    positions = x[None, :] + offsets[:, None]
+    colors = np.repeat([color for _, color, _ in IMPL_STYLES], heights.shape[1])
+
+    ax.bar(positions.ravel(), heights.ravel(), width,
+           color=colors, edgecolor="black", linewidth=0.5)
+
+    return [Patch(facecolor=color, edgecolor="black", linewidth=0.5, label=label)
+            for label, color, _ in IMPL_STYLES]
+
+
+def plot_throughput_vs_msgsize(fig):
     """Plot 1: Throughput (Gbps) vs Message Size."""
-    fig, ax = plt.subplots()
+    ax = fig.add_subplot(111)
 
-    x = np.arange(len(MSG_SIZES))
+    x = MSG_POSITIONS
     width = 0.25
 
-    ax.bar(x - width, throughput_two_copy,  width, label=LABELS["two_copy"],
-           color=COLORS["two_copy"],  edgecolor="black", linewidth=0.5)
-    ax.bar(x,         throughput_one_copy,  width, label=LABELS["one_copy"],
-           color=COLORS["one_copy"],  edgecolor="black", linewidth=0.5)
-    ax.bar(x + width, throughput_zero_copy, width, label=LABELS["zero_copy"],
-           color=COLORS["zero_copy"], edgecolor="black", linewidth=0.5)
+    handles = grouped_bars(ax, x, throughput, width)
 
     ax.set_xlabel("Message Size")
     ax.set_ylabel("Throughput (Gbps)")
     ax.set_title("Throughput vs Message Size\n" + SYSTEM_INFO, fontsize=10)
     ax.set_xticks(x)
     ax.set_xticklabels(MSG_LABELS)
-    ax.legend()
+    ax.legend(handles=handles)
     ax.set_ylim(bottom=0)
 
-    plt.tight_layout()
-    plt.savefig("MT25077_Plot_Throughput_vs_MsgSize.png", bbox_inches="tight")
-    plt.close(fig)
+    fig.tight_layout()
+    save_plot(fig, "MT25077_Plot_Throughput_vs_MsgSize.png")
 
 
-def plot_latency_vs_threads():
+def plot_latency_vs_threads(fig):
     """Plot 2: Latency (us) vs Thread Count."""
-    fig, ax = plt.subplots()
+    ax = fig.add_subplot(111)
 
-    for impl in ["two_copy", "one_copy", "zero_copy"]:
-        data = {
-            "two_copy":  latency_two_copy,
-            "one_copy":  latency_one_copy,
-            "zero_copy": latency_zero_copy,
-        }[impl]
-
-        ax.plot(THREAD_COUNTS, data,
-                marker=MARKERS[impl], color=COLORS[impl],
-                label=LABELS[impl], linewidth=2, markersize=8)
+    for values, (label, color, marker) in zip(latency, IMPL_STYLES):
+        ax.plot(THREAD_COUNTS, values,
+                marker=marker, color=color,
+                label=label, linewidth=2, markersize=8)
 
     ax.set_xlabel("Thread Count")
     ax.set_ylabel("Average Latency (\u00b5s)")
@@ -162,105 +195,94 @@ def plot_latency_vs_threads():
     ax.legend()
     ax.set_ylim(bottom=0)
 
-    plt.tight_layout()
-    plt.savefig("MT25077_Plot_Latency_vs_Threads.png", bbox_inches="tight")
-    plt.close(fig)
+    fig.tight_layout()
+    save_plot(fig, "MT25077_Plot_Latency_vs_Threads.png")
 
 
-def plot_cache_misses_vs_msgsize():
+def plot_cache_misses_vs_msgsize(fig):
     """Plot 3: Cache Misses (L1) and Context Switches vs Message Size."""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    fig.set_size_inches(14, 6)
+    ax1, ax2 = fig.subplots(1, 2)
 
-    x = np.arange(len(MSG_SIZES))
+    x = MSG_POSITIONS
     width = 0.25
 
     # L1 Cache Misses
-    ax1.bar(x - width, l1_misses_two_copy,  width, label=LABELS["two_copy"],
-            color=COLORS["two_copy"],  edgecolor="black", linewidth=0.5)
-    ax1.bar(x,         l1_misses_one_copy,  width, label=LABELS["one_copy"],
-            color=COLORS["one_copy"],  edgecolor="black", linewidth=0.5)
-    ax1.bar(x + width, l1_misses_zero_copy, width, label=LABELS["zero_copy"],
-            color=COLORS["zero_copy"], edgecolor="black", linewidth=0.5)
+    handles = grouped_bars(ax1, x, l1_misses, width)
 
     ax1.set_xlabel("Message Size")
     ax1.set_ylabel("L1 Data Cache Misses")
     ax1.set_title("L1 Cache Misses vs Message Size")
     ax1.set_xticks(x)
     ax1.set_xticklabels(MSG_LABELS)
-    ax1.legend()
+    ax1.legend(handles=handles)
 
     # Context Switches (LLC-load-misses reported 0 on AMD Zen 4 veth)
-    ax2.bar(x - width, ctx_sw_two_copy,  width, label=LABELS["two_copy"],
-            color=COLORS["two_copy"],  edgecolor="black", linewidth=0.5)
-    ax2.bar(x,         ctx_sw_one_copy,  width, label=LABELS["one_copy"],
-            color=COLORS["one_copy"],  edgecolor="black", linewidth=0.5)
-    ax2.bar(x + width, ctx_sw_zero_copy, width, label=LABELS["zero_copy"],
-            color=COLORS["zero_copy"], edgecolor="black", linewidth=0.5)
+    handles = grouped_bars(ax2, x, ctx_sw, width)
 
     ax2.set_xlabel("Message Size")
     ax2.set_ylabel("Context Switches")
     ax2.set_title("Context Switches vs Message Size")
     ax2.set_xticks(x)
     ax2.set_xticklabels(MSG_LABELS)
-    ax2.legend()
+    ax2.legend(handles=handles)
 
     fig.suptitle("Cache Misses & Context Switches vs Message Size\n" + SYSTEM_INFO,
                  fontsize=10)
-    plt.tight_layout()
-    plt.savefig("MT25077_Plot_CacheMisses_vs_MsgSize.png", bbox_inches="tight")
-    plt.close(fig)
+    fig.tight_layout()
+    save_plot(fig, "MT25077_Plot_CacheMisses_vs_MsgSize.png")
 
 
-def plot_cycles_per_byte():
+def plot_cycles_per_byte(fig):
     """Plot 4: CPU Cycles per Byte Transferred vs Message Size."""
-    fig, ax = plt.subplots()
-
-    for impl in ["two_copy", "one_copy", "zero_copy"]:
-        data = {
-            "two_copy":  cycles_per_byte_two_copy,
-            "one_copy":  cycles_per_byte_one_copy,
-            "zero_copy": cycles_per_byte_zero_copy,
-        }[impl]
+    ax = fig.add_subplot(111)
 
-        ax.plot(MSG_SIZES, data,
-                marker=MARKERS[impl], color=COLORS[impl],
-                label=LABELS[impl], linewidth=2, markersize=8)
+    for values, (label, color, marker) in zip(cycles_per_byte, IMPL_STYLES):
+        ax.plot(MSG_SIZES, values,
+                marker=marker, color=color,
+                label=label, linewidth=2, markersize=8)
 
     ax.set_xlabel("Message Size (bytes)")
     ax.set_ylabel("CPU Cycles per Byte")
     ax.set_title("CPU Cycles per Byte vs Message Size\n" + SYSTEM_INFO,
                  fontsize=10)
     ax.set_xscale("log", base=2)
-    ax.xaxis.set_major_formatter(ticker.FuncFormatter(
-        lambda x, _: f"{int(x)}" if x < 1024
-        else f"{int(x/1024)}KB" if x < 1048576
-        else f"{int(x/1048576)}MB"
-    ))
+    ax.set_xticks(MSG_SIZES)
+    ax.set_xticklabels(MSG_LABELS)
+    ax.minorticks_off()
     ax.legend()
     ax.set_ylim(bottom=0)
 
-    plt.tight_layout()
-    plt.savefig("MT25077_Plot_CyclesPerByte_vs_MsgSize.png",
-                bbox_inches="tight")
-    plt.close(fig)
+    fig.tight_layout()
+    save_plot(fig, "MT25077_Plot_CyclesPerByte_vs_MsgSize.png")
 
 
 # ============================================================
 # Main: generate all 4 plots
 # ============================================================
 
-if __name__ == "__main__":
-    print("Generating Plot 1: Throughput vs Message Size...")
-    plot_throughput_vs_msgsize()
+# The plots are independent, so each one is rendered in its own worker
+# process (Agg rendering is CPU-bound and holds the GIL)
+PLOTS = [
+    ("plot_throughput_vs_msgsize",   "Plot 1: Throughput vs Message Size"),
+    ("plot_latency_vs_threads",      "Plot 2: Latency vs Thread Count"),
+    ("plot_cache_misses_vs_msgsize", "Plot 3: Cache Misses vs Message Size"),
+    ("plot_cycles_per_byte",         "Plot 4: CPU Cycles per Byte"),
+]
 
-    print("Generating Plot 2: Latency vs Thread Count...")
-    plot_latency_vs_threads()
 
-    print("Generating Plot 3: Cache Misses vs Message Size...")
-    plot_cache_misses_vs_msgsize()
+def run_plot(plot):
+    """Worker entry point: render one plot, given by function name, on a fresh figure."""
+    name, description = plot
+    print(f"Generating {description}...", flush=True)
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    globals()[name](fig)
 
-    print("Generating Plot 4: CPU Cycles per Byte...")
-    plot_cycles_per_byte()
+
+if __name__ == "__main__":
+    with Pool(len(PLOTS)) as pool:
+        pool.map(run_plot, PLOTS)
 
     print("\nAll plots generated successfully.")
     print("PNG files saved in current directory.")